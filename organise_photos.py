@@ -6,124 +6,641 @@ of HEIC Live Photos to JPEG stills.
 
 Dependencies:
   - Python 3.x
-  - Pillow (for reading EXIF data): pip install Pillow
+  - Pillow (for EXIF data in formats other than JPEG/TIFF, and HEIC conversion): pip install Pillow
   - pillow-heif (for HEIC support): pip install pillow-heif
 
 Usage:
-  python organize_photos.py --source "path/to/source" --dest "path/to/destination" [--move] [--heic-to-jpeg]
+  python organize_photos.py --source "path/to/source" --dest "path/to/destination" [--move] [--heic-to-jpeg] [--workers N] [--quiet]
 """
 import os
 import sys
+import errno
 import argparse
 import shutil
+import struct
+import queue
+import threading
+import multiprocessing
+import time
+from collections import Counter
+from importlib.util import find_spec
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 
-# Attempt to import Pillow and HEIC support
-try:
-    from PIL import Image, ExifTags
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
-try:
-    import pillow_heif
-    pillow_heif.register_heif_opener()
-    HEIF_AVAILABLE = True
-except ImportError:
-    HEIF_AVAILABLE = False
+# Check for Pillow and HEIC support without importing them: Pillow is only
+# needed for non-JPEG/TIFF EXIF and HEIC conversion, so it's loaded on first use
+PIL_AVAILABLE = find_spec('PIL') is not None
+HEIF_AVAILABLE = PIL_AVAILABLE and find_spec('pillow_heif') is not None
+_Image = None
 
 # Supported file extensions
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.tiff', '.bmp', '.heic'}
 VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.mts', '.wmv'}
+MEDIA_EXTENSIONS = frozenset(IMAGE_EXTENSIONS | VIDEO_EXTENSIONS)
+# Images that may carry EXIF DateTimeOriginal (HEIC dates come from mtime)
+EXIF_EXTENSIONS = frozenset(IMAGE_EXTENSIONS - {'.heic'})
+
+# EXIF tag id for original date/time (DateTimeOriginal)
+EXIF_DATETIME_TAG = 0x9003
+
+# Formats whose EXIF header fast_exif_dto can parse without Pillow
+FAST_EXIF_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.tiff'})
+
+# Only this much of a file is read when looking for EXIF DateTimeOriginal
+EXIF_READ_SIZE = 64 * 1024
+
+_JPEG_SOI = b'\xff\xd8'
+_EXIF_HEADER = b'Exif\x00\x00'
+_TAG_EXIF_IFD = 0x8769
+_BE_U16 = struct.Struct('>H')
+# TIFF byte order mark -> (u16, u32, 12-byte IFD entry) parsers
+_TIFF_STRUCTS = {
+    b'II': (struct.Struct('<H'), struct.Struct('<I'), struct.Struct('<HHII')),
+    b'MM': (struct.Struct('>H'), struct.Struct('>I'), struct.Struct('>HHII')),
+}
+
+# Planned files allowed to wait for a worker before the scan pauses
+JOB_QUEUE_SIZE = 1024
+
+# Log output is written in batches of up to this many characters...
+LOG_BATCH_SIZE = 64 * 1024
+# ...or whatever has arrived within this many seconds of the first pending line
+LOG_FLUSH_INTERVAL = 0.1
+
+# Chunk size for file copies; also used by shutil's own fallback copy loops
+COPY_BUFSIZE = 1024 * 1024
+shutil.COPY_BUFSIZE = COPY_BUFSIZE
 
-# EXIF tag for original date/time
-EXIF_DATETIME_TAG = 'DateTimeOriginal'
+# Page-cache hints are only issued on Linux, where posix_fadvise is honoured
+FADVISE_AVAILABLE = sys.platform.startswith('linux') and hasattr(os, 'posix_fadvise')
 
+# errnos meaning "this zero-copy syscall can't be used here", not a real I/O failure
+_FASTCOPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY}
 
-def get_creation_date(path):
+
+def get_extension(filename):
+    """
+    Return the lowercased extension of filename including the dot, or '' if none.
     """
-    Get the creation date for a file.
-    For images, attempt to read EXIF DateTimeOriginal.
-    Otherwise, fallback to file modification time.
+    dot, _, ext = filename.rpartition('.')
+    if not dot:
+        return ''
+    return '.' + ext.lower()
+
+
+def iter_media(root, on_error=print):
     """
-    ext = os.path.splitext(path)[1].lower()
-    if PIL_AVAILABLE and ext in IMAGE_EXTENSIONS and ext != '.heic':
+    Yield (DirEntry, ext) for photos/videos under root, in os.walk top-down order.
+    Unreadable directories are skipped and reported by calling on_error with a message.
+    Uses os.scandir so type checks and stat data come from the cached dirent,
+    and an explicit stack instead of nested generators, so entries aren't
+    relayed through one generator frame per directory level.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        subdirs = []
         try:
-            img = Image.open(path)
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        ext = get_extension(entry.name)
+                        if ext in MEDIA_EXTENSIONS:
+                            yield entry, ext
+        except OSError as e:
+            on_error(f"Cannot read directory {path}: {e}")
+            continue
+        # Reversed so subdirectories are popped in the order scandir listed them
+        stack.extend(reversed(subdirs))
+
+
+def parse_exif_datetime(value):
+    """
+    Parse an EXIF 'YYYY:MM:DD HH:MM:SS' string by slicing, skipping strptime's
+    format and locale handling. Raises ValueError if it isn't in that form.
+    """
+    fields = (value[0:4], value[5:7], value[8:10], value[11:13], value[14:16], value[17:19])
+    # int() alone would accept signs and padding such as '+019' or ' 6'
+    if len(value) != 19 or value[4] != ':' or value[7] != ':' or value[10] != ' ' \
+            or value[13] != ':' or value[16] != ':' \
+            or not all(f.isascii() and f.isdigit() for f in fields):
+        raise ValueError(f"not an EXIF datetime: {value!r}")
+    return datetime(*map(int, fields))
+
+
+def _find_exif_tiff(data):
+    """
+    Walk the JPEG marker segments in data and return the offset of the TIFF header
+    inside the EXIF APP1 segment, or None if the image has no EXIF segment.
+    """
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            raise ValueError("bad JPEG marker")
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):
+            # End of image / start of scan: no more metadata segments
+            return None
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            # Markers without a length field
+            pos += 2
+            continue
+        length = _BE_U16.unpack_from(data, pos + 2)[0]
+        if marker == 0xE1 and data[pos + 4:pos + 10] == _EXIF_HEADER:
+            return pos + 10
+        pos += 2 + length
+    raise ValueError("EXIF segment not found in header window")
+
+
+def _find_ifd_entry(data, base, ifd_offset, tag, u16, entry):
+    """
+    Return (type, count, value, value_pos) of tag in the IFD at ifd_offset, or None.
+    """
+    pos = base + ifd_offset
+    count = u16.unpack_from(data, pos)[0]
+    pos += 2
+    for _ in range(count):
+        entry_tag, entry_type, entry_count, value = entry.unpack_from(data, pos)
+        if entry_tag == tag:
+            return entry_type, entry_count, value, pos + 8
+        pos += 12
+    return None
+
+
+def _parse_exif_dto(data):
+    """
+    Extract DateTimeOriginal from the leading bytes of a JPEG or TIFF file.
+    Returns None if the file has no such tag; raises ValueError or struct.error
+    if the header can't be parsed from data.
+    """
+    if data[:2] == _JPEG_SOI:
+        base = _find_exif_tiff(data)
+        if base is None:
+            return None
+    elif data[:4] in (b'II*\x00', b'MM\x00*'):
+        base = 0
+    else:
+        raise ValueError("not a JPEG or TIFF file")
+
+    structs = _TIFF_STRUCTS.get(data[base:base + 2])
+    if structs is None:
+        raise ValueError("bad TIFF byte order")
+    u16, u32, entry = structs
+
+    ifd0 = u32.unpack_from(data, base + 4)[0]
+    found = _find_ifd_entry(data, base, ifd0, _TAG_EXIF_IFD, u16, entry)
+    if found is None:
+        return None
+    found = _find_ifd_entry(data, base, found[2], EXIF_DATETIME_TAG, u16, entry)
+    if found is None:
+        return None
+
+    _, count, value, value_pos = found
+    if count <= 4:
+        raw = data[value_pos:value_pos + count]
+    else:
+        raw = data[base + value:base + value + count]
+    if len(raw) != count:
+        raise ValueError("EXIF value outside header window")
+    return parse_exif_datetime(raw.rstrip(b'\x00 ').decode('ascii'))
+
+
+def fast_exif_dto_fd(fd):
+    """
+    Like fast_exif_dto, but reads from an already-open file descriptor.
+    Uses pread where available, so the descriptor's file offset is left untouched.
+    """
+    if hasattr(os, 'pread'):
+        return _parse_exif_dto(os.pread(fd, EXIF_READ_SIZE, 0))
+    os.lseek(fd, 0, os.SEEK_SET)
+    return _parse_exif_dto(os.read(fd, EXIF_READ_SIZE))
+
+
+def fast_exif_dto(path):
+    """
+    Read EXIF DateTimeOriginal from a JPEG or TIFF by parsing only its first 64 KiB.
+    Returns None if the tag is absent; raises on anything it can't parse.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return fast_exif_dto_fd(fd)
+    finally:
+        os.close(fd)
+
+
+def _load_image():
+    """
+    Import PIL.Image on first use, registering the HEIC opener if pillow-heif is installed.
+    An installed but unimportable package (e.g. pillow-heif without libheif) clears its
+    *_AVAILABLE flag, so it isn't retried for every file; a broken Pillow re-raises.
+    """
+    global _Image, PIL_AVAILABLE, HEIF_AVAILABLE
+    if _Image is None:
+        try:
+            from PIL import Image
+        except ImportError:
+            PIL_AVAILABLE = HEIF_AVAILABLE = False
+            raise
+        if HEIF_AVAILABLE:
+            try:
+                import pillow_heif
+                pillow_heif.register_heif_opener()
+            except ImportError:
+                HEIF_AVAILABLE = False
+        _Image = Image
+    return _Image
+
+
+def pil_exif_dto(path):
+    """
+    Read EXIF DateTimeOriginal through Pillow. Returns None if unavailable.
+    """
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        with _load_image().open(path) as img:
             exif_data = img._getexif() or {}
-            for tag, value in exif_data.items():
-                decoded = ExifTags.TAGS.get(tag, tag)
-                if decoded == EXIF_DATETIME_TAG:
-                    return datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-        except Exception:
+        value = exif_data.get(EXIF_DATETIME_TAG)
+        if value:
+            return parse_exif_datetime(value)
+    except Exception:
+        pass
+    return None
+
+
+def get_exif_date(entry, ext):
+    """
+    Get EXIF DateTimeOriginal for an image, or None if it has none.
+    Uses the byte-level parser for JPEG/TIFF and Pillow for other formats
+    or when that parser gives up.
+    """
+    if ext in FAST_EXIF_EXTENSIONS:
+        try:
+            return fast_exif_dto(entry.path)
+        except (OSError, ValueError, struct.error):
+            return pil_exif_dto(entry.path)
+    if ext in EXIF_EXTENSIONS:
+        return pil_exif_dto(entry.path)
+    return None
+
+
+def _copy_fd(src_fd, dst_fd):
+    """
+    Copy the rest of src_fd into dst_fd, preferring in-kernel copies.
+    Tries copy_file_range, then sendfile (Linux only), then a buffered read/write loop.
+    Each step continues from the current file offsets, so a partial copy is resumed.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, 2 ** 30):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _FASTCOPY_FALLBACK_ERRNOS:
+                raise
+
+    if sys.platform.startswith('linux'):
+        try:
+            while os.sendfile(dst_fd, src_fd, None, 2 ** 30):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _FASTCOPY_FALLBACK_ERRNOS:
+                raise
+
+    buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as src:
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += os.write(dst_fd, view[written:n])
+
+
+def _fadvise(fd, advice):
+    """
+    Best-effort posix_fadvise over the whole file, with advice given by name
+    (e.g. 'POSIX_FADV_DONTNEED'); a no-op where unsupported.
+    """
+    if FADVISE_AVAILABLE:
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
             pass
 
-    # Fallback: file modification time
-    mod_time = os.path.getmtime(path)
-    return datetime.fromtimestamp(mod_time)
+
+def _fast_copy(src_path, dest_path):
+    """
+    Copy file data and metadata like shutil.copy2, using the zero-copy path where available.
+    On Linux, both files' pages are dropped from the page cache afterwards so a bulk
+    copy doesn't evict everything else. Never overwrites: raises FileExistsError if
+    dest_path already exists.
+    """
+    flags = getattr(os, 'O_BINARY', 0)
+    src_fd = os.open(src_path, os.O_RDONLY | flags)
+    try:
+        _fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+        dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | flags, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd)
+            _fadvise(dst_fd, 'POSIX_FADV_DONTNEED')
+        finally:
+            os.close(dst_fd)
+        _fadvise(src_fd, 'POSIX_FADV_DONTNEED')
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src_path, dest_path)
+    return dest_path
+
+
+def _fast_move(src_path, dest_path, same_device=True):
+    """
+    Move a file by renaming it, copying and unlinking only when it crosses filesystems.
+    same_device=False skips the rename attempt when the caller already knows it will fail.
+    Raises FileExistsError rather than replacing an existing dest_path.
+    """
+    if same_device:
+        # os.replace would silently overwrite, so check right before renaming
+        if os.path.lexists(dest_path):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest_path)
+        try:
+            os.replace(src_path, dest_path)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+    _fast_copy(src_path, dest_path)
+    os.unlink(src_path)
+
+
+def _process_one(src_path, dest_path, ext, timestamp=None, move_files=False, convert_heic=False,
+                 same_device=True):
+    """
+    Copy, move or convert a single file whose destination is already resolved.
+    If timestamp is given, it becomes the destination's atime/mtime.
+    Runs inside a worker, so it returns (action, log line) instead of printing.
+    """
+    if convert_heic and ext == '.heic':
+        try:
+            with _load_image().open(src_path) as img, open(dest_path, 'xb') as dest:
+                img.save(dest, 'JPEG')
+            if timestamp is not None:
+                os.utime(dest_path, (timestamp, timestamp))
+            if move_files:
+                os.remove(src_path)
+        except Exception as e:
+            return 'Failed', f"Failed to convert {src_path}: {e}"
+        return 'Converted', f"Converted: {src_path} -> {dest_path}"
+
+    if move_files:
+        _fast_move(src_path, dest_path, same_device)
+        action = 'Moved'
+    else:
+        _fast_copy(src_path, dest_path)
+        action = 'Copied'
+    if timestamp is not None:
+        os.utime(dest_path, (timestamp, timestamp))
+    return action, f"{action}: {src_path} -> {dest_path}"
 
 
-def organize_files(source_dir, dest_dir, move_files=False, convert_heic=False):
+def _write_log(log_q, counts, quiet=False, stream=None):
+    """
+    Drain (action, message) pairs from log_q until a None sentinel, tallying actions
+    into counts and writing messages to stream in batches, so workers never block on
+    the terminal. With quiet, only failures are written.
+    Unencodable characters (e.g. undecodable filename bytes) are backslash-escaped, and
+    a failing stream stops output but never stops the draining or the tally.
+    """
+    stream = stream or sys.stdout
+    encoding = getattr(stream, 'encoding', None) or 'utf-8'
+    writable = True
+    done = False
+    while not done:
+        item = log_q.get()
+        batch = []
+        size = 0
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while item is not None:
+            action, message = item
+            counts[action] += 1
+            if not quiet or action == 'Failed':
+                batch.append(message)
+                size += len(message) + 1
+            remaining = deadline - time.monotonic()
+            if size >= LOG_BATCH_SIZE or remaining <= 0:
+                break
+            try:
+                item = log_q.get(timeout=remaining)
+            except queue.Empty:
+                break
+        else:
+            done = True
+        if batch and writable:
+            text = '\n'.join(batch) + '\n'
+            text = text.encode(encoding, 'backslashreplace').decode(encoding)
+            try:
+                stream.write(text)
+                stream.flush()
+            except (OSError, ValueError):
+                # e.g. a closed pipe; keep counting so the summary and exit status stay right
+                writable = False
+
+
+def _plan_files(source_dir, dest_dir, convert_heic=False, on_error=print):
+    """
+    Yield (src_path, dest_path, ext, timestamp) for every photo/video under source_dir.
+    timestamp is the date to stamp on the destination as its mtime, or None to keep
+    the source's: EXIF dates are written back so later runs can rely on mtime.
+    Resolves the date, creates the year/month folder and picks a collision-free name,
+    so it must run in a single thread. Scan errors are passed to on_error.
+    """
+    # (year, month) -> target folder, created on first use
+    folder_cache = {}
+    # Folder -> names present in it (on disk or claimed by this run), seeded by one listdir
+    existing_names = {}
+    # (folder, dest_name) -> next collision suffix to try
+    counters = {}
+    for entry, ext in iter_media(source_dir, on_error):
+        filename = entry.name
+        converting = convert_heic and ext == '.heic'
+        # Creation date: EXIF DateTimeOriginal for images, else file modification time
+        exif_date = get_exif_date(entry, ext)
+        if exif_date is not None:
+            date = exif_date
+            try:
+                timestamp = exif_date.timestamp()
+            except (ValueError, OverflowError, OSError):
+                # Garbage dates like 0001:01:01 still pick the folder but can't be an mtime
+                timestamp = entry.stat().st_mtime if converting else None
+        else:
+            mod_time = entry.stat().st_mtime
+            date = datetime.fromtimestamp(mod_time)
+            # A converted file is new, so it needs the source's mtime set explicitly
+            timestamp = mod_time if converting else None
+        month_key = (date.year, date.month)
+        target_folder = folder_cache.get(month_key)
+        if target_folder is None:
+            target_folder = os.path.join(dest_dir, f"{date.year:04d}", f"{date.month:02d}")
+            try:
+                os.makedirs(target_folder)
+                # Freshly created, so nothing on disk can collide
+                existing_names[target_folder] = set()
+            except FileExistsError:
+                existing_names[target_folder] = set(os.listdir(target_folder))
+            folder_cache[month_key] = target_folder
+
+        # Determine destination path
+        if converting:
+            # Convert to JPEG; ext is the lowercased suffix, so strip it by length
+            dest_name = f"{filename[:-len(ext)]}.jpg"
+        else:
+            dest_name = filename
+
+        # Handle filename collisions
+        names = existing_names[target_folder]
+        final_name = dest_name
+        if final_name in names:
+            key = (target_folder, dest_name)
+            counter = counters.get(key, 1)
+            name, extn = os.path.splitext(dest_name)
+            while final_name in names:
+                final_name = f"{name}_{counter}{extn}"
+                counter += 1
+            counters[key] = counter
+        names.add(final_name)
+
+        yield entry.path, os.path.join(target_folder, final_name), ext, timestamp
+
+
+def organize_files(source_dir, dest_dir, move_files=False, convert_heic=False, workers=None, quiet=False):
     """
     Walk through source_dir, find photos/videos, and copy (or move) into dest_dir organized by year/month.
     Optionally convert HEIC files to JPEG stills.
+
+    A producer thread scans and plans files into a bounded queue while worker threads
+    copy/move/convert them, so metadata reads overlap with data transfer.
+    workers sets how many files are in flight at once (default: 2x CPU count for
+    copies, CPU count for HEIC conversion).
+    Per-file lines go through a single logger thread; quiet keeps only failures.
+    A summary of what was done is printed at the end; exits with status 1 if any file failed.
     """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
     if not os.path.isdir(source_dir):
         print(f"Source directory does not exist: {source_dir}")
         sys.exit(1)
 
+    if convert_heic and HEIF_AVAILABLE:
+        # Import Pillow before any thread exists, so no thread can be caught mid-import;
+        # this also confirms pillow-heif actually imports, not just that it's installed
+        try:
+            _load_image()
+        except ImportError:
+            pass
+
     if convert_heic and not HEIF_AVAILABLE:
         print("Error: pillow-heif is required for HEIC conversion. Install with 'pip install pillow-heif'.")
         sys.exit(1)
 
     os.makedirs(dest_dir, exist_ok=True)
 
-    for root, _, files in os.walk(source_dir):
-        for filename in files:
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in IMAGE_EXTENSIONS or ext in VIDEO_EXTENSIONS:
-                src_path = os.path.join(root, filename)
-                date = get_creation_date(src_path)
-                year = date.strftime('%Y')
-                month = date.strftime('%m')
-                target_folder = os.path.join(dest_dir, year, month)
-                os.makedirs(target_folder, exist_ok=True)
-
-                base = os.path.splitext(filename)[0]
-                # Determine destination path
-                if convert_heic and ext == '.heic':
-                    # Convert to JPEG
-                    dest_name = f"{base}.jpg"
-                else:
-                    dest_name = filename
-
-                dest_path = os.path.join(target_folder, dest_name)
-                # Handle filename collisions
-                counter = 1
-                while os.path.exists(dest_path):
-                    name = os.path.splitext(dest_name)[0]
-                    extn = os.path.splitext(dest_name)[1]
-                    dest_path = os.path.join(target_folder, f"{name}_{counter}{extn}")
-                    counter += 1
-
-                # Perform operation
-                if convert_heic and ext == '.heic':
-                    try:
-                        with Image.open(src_path) as img:
-                            img.save(dest_path, 'JPEG')
-                        print(f"Converted: {src_path} -> {dest_path}")
-                        if move_files:
-                            os.remove(src_path)
-                    except Exception as e:
-                        print(f"Failed to convert {src_path}: {e}")
+    cpus = os.cpu_count() or 1
+    if workers is None:
+        workers = cpus if convert_heic else 2 * cpus
+
+    # A different st_dev means every rename would fail with EXDEV, so don't try
+    same_device = os.stat(source_dir).st_dev == os.stat(dest_dir).st_dev
+    process = partial(_process_one, move_files=move_files, convert_heic=convert_heic,
+                      same_device=same_device)
+
+    # HEIC decode/encode is CPU-bound, so each worker thread hands its file to a
+    # process pool; plain copies release the GIL and run in the threads directly.
+    # Pool workers are started lazily from those threads, so they must not be forked
+    # from this (by then multi-threaded) process: forkserver/spawn start them clean.
+    pool = None
+    if convert_heic:
+        methods = multiprocessing.get_all_start_methods()
+        method = 'forkserver' if 'forkserver' in methods else 'spawn'
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+    jobs = queue.Queue(maxsize=JOB_QUEUE_SIZE)
+    log_q = queue.Queue()
+    counts = Counter()
+    producer_errors = []
+
+    def log_failure(message):
+        log_q.put(('Failed', message))
+
+    def produce():
+        try:
+            for job in _plan_files(source_dir, dest_dir, convert_heic, log_failure):
+                jobs.put(job)
+        except Exception as e:
+            producer_errors.append(e)
+        finally:
+            for _ in range(workers):
+                jobs.put(None)
+
+    def consume():
+        while (job := jobs.get()) is not None:
+            try:
+                # job[2] is the extension; only conversions need a process
+                if pool is not None and job[2] == '.heic':
+                    result = pool.submit(process, *job).result()
                 else:
-                    if move_files:
-                        shutil.move(src_path, dest_path)
-                        action = 'Moved'
-                    else:
-                        shutil.copy2(src_path, dest_path)
-                        action = 'Copied'
-                    print(f"{action}: {src_path} -> {dest_path}")
+                    result = process(*job)
+            except Exception as e:
+                result = 'Failed', f"Failed to process {job[0]}: {e}"
+            log_q.put(result)
+
+    logger = threading.Thread(target=_write_log, args=(log_q, counts, quiet), daemon=True)
+    threads = [threading.Thread(target=produce, daemon=True)]
+    threads += [threading.Thread(target=consume, daemon=True) for _ in range(workers)]
+    logger.start()
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        log_q.put(None)
+        logger.join()
+
+    summary = ', '.join(f"{n} {action.lower()}" for action, n in sorted(counts.items()))
+    if producer_errors:
+        print(f"Stopped early: {summary or 'nothing processed'}")
+        raise producer_errors[0]
+    print(f"Done: {summary or 'no photos or videos found'}")
+
+    # Let callers (e.g. scripts wrapping a --move import) detect a partial failure
+    if counts['Failed']:
+        sys.exit(1)
+
+
+def _positive_int(value):
+    """
+    argparse type for options that need an integer of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 if __name__ == '__main__':
@@ -146,6 +663,15 @@ if __name__ == '__main__':
         '--heic-to-jpeg', dest='convert_heic', action='store_true',
         help="Convert HEIC Live Photos to JPEG stills instead of copying"
     )
+    parser.add_argument(
+        '--quiet', '-q', action='store_true',
+        help="Only report failures and the final summary"
+    )
+    parser.add_argument(
+        '--workers', '-j', type=_positive_int, default=None,
+        help="Number of files to copy/convert concurrently (default: 2x CPU count, or CPU count with --heic-to-jpeg)"
+    )
 
     args = parser.parse_args()
-    organize_files(args.source, args.dest, move_files=args.move, convert_heic=args.convert_heic)
+    organize_files(args.source, args.dest, move_files=args.move, convert_heic=args.convert_heic,
+                   workers=args.workers, quiet=args.quiet)
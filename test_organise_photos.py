@@ -0,0 +1,286 @@
+"""
+Tests for organise_photos: the byte-level EXIF DateTimeOriginal parser, destination
+name planning, the batching logger and the move fallback.
+
+Run with: python -m unittest test_organise_photos
+"""
+import errno
+import io
+import os
+import queue
+import struct
+import tempfile
+import unittest
+from collections import Counter
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import organise_photos
+
+DTO = b'2019:07:04 12:34:56\x00'
+
+
+def make_tiff(byte_order, dto=DTO, dto_offset=None):
+    """
+    Build a TIFF header with IFD0 -> ExifIFD -> DateTimeOriginal.
+    Values of 4 bytes or fewer are stored inline in the IFD entry; longer ones are
+    written at dto_offset (default: right after the ExifIFD).
+    """
+    p = '<' if byte_order == b'II' else '>'
+    magic = struct.pack(p + 'H', 42)
+    exif_ifd = 8 + 2 + 12 + 4
+    value_pos = exif_ifd + 2 + 12 + 4
+    if dto_offset is None:
+        dto_offset = value_pos
+
+    data = byte_order + magic + struct.pack(p + 'I', 8)
+    data += struct.pack(p + 'H', 1) + struct.pack(p + 'HHII', 0x8769, 4, 1, exif_ifd) + b'\x00' * 4
+    if len(dto) <= 4:
+        inline = struct.unpack(p + 'I', dto.ljust(4, b'\x00'))[0]
+        data += struct.pack(p + 'H', 1) + struct.pack(p + 'HHII', 0x9003, 2, len(dto), inline)
+        return data + b'\x00' * 4
+    data += struct.pack(p + 'H', 1) + struct.pack(p + 'HHII', 0x9003, 2, len(dto), dto_offset)
+    data += b'\x00' * 4
+    data += b'\x00' * (dto_offset - len(data))
+    return data + dto
+
+
+def make_jpeg(tiff=None):
+    """
+    Wrap a TIFF header in a JPEG with a JFIF APP0 segment and, if given, an EXIF APP1 segment.
+    """
+    data = b'\xff\xd8'
+    data += b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    if tiff is not None:
+        body = b'Exif\x00\x00' + tiff
+        data += b'\xff\xe1' + struct.pack('>H', len(body) + 2) + body
+    return data + b'\xff\xda\x00\x08' + b'\x00' * 6 + b'\xff\xd9'
+
+
+class ParseExifDtoTest(unittest.TestCase):
+
+    def test_little_endian_jpeg(self):
+        data = make_jpeg(make_tiff(b'II'))
+        self.assertEqual(organise_photos._parse_exif_dto(data), datetime(2019, 7, 4, 12, 34, 56))
+
+    def test_big_endian_jpeg(self):
+        data = make_jpeg(make_tiff(b'MM'))
+        self.assertEqual(organise_photos._parse_exif_dto(data), datetime(2019, 7, 4, 12, 34, 56))
+
+    def test_bare_tiff(self):
+        data = make_tiff(b'MM')
+        self.assertEqual(organise_photos._parse_exif_dto(data), datetime(2019, 7, 4, 12, 34, 56))
+
+    def test_inline_value_is_read_from_entry(self):
+        # A 4-byte value lives in the entry itself, not at an offset; it isn't a
+        # valid datetime, so the parser must reject exactly those bytes.
+        data = make_jpeg(make_tiff(b'II', dto=b'abc\x00'))
+        with self.assertRaisesRegex(ValueError, "'abc'"):
+            organise_photos._parse_exif_dto(data)
+
+    def test_jpeg_without_app1_has_no_date(self):
+        self.assertIsNone(organise_photos._parse_exif_dto(make_jpeg()))
+
+    def test_truncated_ifd_raises(self):
+        data = make_jpeg(make_tiff(b'II'))
+        # SOI (2) + APP0 (18) + APP1 marker/length/'Exif' (10) + TIFF header (8)
+        # + IFD0 entry count (2), then cut 5 bytes into IFD0's first entry
+        truncated = data[:2 + 18 + 10 + 8 + 2 + 5]
+        with self.assertRaises((ValueError, struct.error)):
+            organise_photos._parse_exif_dto(truncated)
+
+    def test_malformed_datetime_raises(self):
+        data = make_jpeg(make_tiff(b'II', dto=b'+019:07:04 12:34:56\x00'))
+        with self.assertRaises(ValueError):
+            organise_photos._parse_exif_dto(data)
+
+
+class GetExifDateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return SimpleNamespace(path=path, name=name)
+
+    def test_reads_date_without_pillow(self):
+        entry = self.write('a.jpg', make_jpeg(make_tiff(b'II')))
+        with mock.patch.object(organise_photos, 'pil_exif_dto') as pil:
+            self.assertEqual(organise_photos.get_exif_date(entry, '.jpg'), datetime(2019, 7, 4, 12, 34, 56))
+        pil.assert_not_called()
+
+    def test_value_outside_read_window_falls_back_to_pillow(self):
+        # The value starts inside the 64 KiB window but ends past it, while the
+        # APP1 segment still fits its 16-bit length
+        tiff = make_tiff(b'II', dto_offset=organise_photos.EXIF_READ_SIZE - 40)
+        entry = self.write('b.jpg', make_jpeg(tiff))
+        fallback = datetime(2001, 2, 3, 4, 5, 6)
+        with mock.patch.object(organise_photos, 'pil_exif_dto', return_value=fallback) as pil:
+            self.assertEqual(organise_photos.get_exif_date(entry, '.jpg'), fallback)
+        pil.assert_called_once_with(entry.path)
+
+
+class TempDirTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = os.path.join(self.tmp.name, 'src')
+        self.dest = os.path.join(self.tmp.name, 'dest')
+        os.makedirs(self.src)
+
+    def touch(self, relpath, data=b'', mtime=None):
+        path = os.path.join(self.tmp.name, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+
+class PlanFilesTest(TempDirTestCase):
+
+    MTIME = datetime(2020, 5, 17, 12, 0, 0).timestamp()
+
+    def plan(self):
+        return list(organise_photos._plan_files(self.src, self.dest))
+
+    def month_folder(self):
+        return os.path.join(self.dest, '2020', '05')
+
+    def planned_names(self, jobs):
+        return sorted(os.path.relpath(dest_path, self.month_folder()) for _, dest_path, _, _ in jobs)
+
+    def test_new_folder_is_created(self):
+        self.touch('src/a.mov', mtime=self.MTIME)
+        jobs = self.plan()
+        self.assertTrue(os.path.isdir(self.month_folder()))
+        self.assertEqual(self.planned_names(jobs), ['a.mov'])
+
+    def test_repeated_names_get_suffix_chain(self):
+        for sub in ('x', 'y', 'z'):
+            self.touch(f'src/{sub}/a.mov', mtime=self.MTIME)
+        self.assertEqual(self.planned_names(self.plan()), ['a.mov', 'a_1.mov', 'a_2.mov'])
+
+    def test_existing_folder_contents_are_avoided(self):
+        self.touch('dest/2020/05/a.mov')
+        self.touch('dest/2020/05/a_1.mov')
+        self.touch('src/a.mov', mtime=self.MTIME)
+        self.assertEqual(self.planned_names(self.plan()), ['a_2.mov'])
+
+    def test_suffixed_source_name_collides_with_generated_name(self):
+        self.touch('src/x/a.mov', mtime=self.MTIME)
+        self.touch('src/y/a.mov', mtime=self.MTIME)
+        self.touch('src/z/a_1.mov', mtime=self.MTIME)
+        names = self.planned_names(self.plan())
+        self.assertEqual(len(set(names)), 3)
+        self.assertIn('a.mov', names)
+        self.assertIn('a_1.mov', names)
+
+    def test_non_media_files_are_skipped(self):
+        self.touch('src/notes.txt', mtime=self.MTIME)
+        self.touch('src/.jpg', mtime=self.MTIME)
+        self.assertEqual(self.plan(), [])
+
+
+class WriteLogTest(unittest.TestCase):
+
+    def run_log(self, items, quiet=False, stream=None):
+        log_q = queue.Queue()
+        for item in items:
+            log_q.put(item)
+        log_q.put(None)
+        counts = Counter()
+        stream = stream if stream is not None else io.StringIO()
+        organise_photos._write_log(log_q, counts, quiet=quiet, stream=stream)
+        return counts, stream
+
+    def test_writes_and_counts_until_sentinel(self):
+        counts, stream = self.run_log([('Copied', 'Copied: a'), ('Failed', 'Failed: b')])
+        self.assertEqual(counts, Counter({'Copied': 1, 'Failed': 1}))
+        self.assertEqual(stream.getvalue(), 'Copied: a\nFailed: b\n')
+
+    def test_quiet_writes_only_failures(self):
+        counts, stream = self.run_log([('Copied', 'Copied: a'), ('Failed', 'Failed: b')], quiet=True)
+        self.assertEqual(counts, Counter({'Copied': 1, 'Failed': 1}))
+        self.assertEqual(stream.getvalue(), 'Failed: b\n')
+
+    def test_output_larger_than_one_batch_is_complete(self):
+        lines = [f"Copied: {i:05d} " + 'x' * 1000 for i in range(200)]
+        counts, stream = self.run_log([('Copied', line) for line in lines])
+        self.assertEqual(counts['Copied'], 200)
+        self.assertEqual(stream.getvalue().splitlines(), lines)
+
+    def test_unencodable_filename_is_escaped(self):
+        _, stream = self.run_log([('Copied', 'Copied: caf\udce9.mov')])
+        self.assertEqual(stream.getvalue(), 'Copied: caf\\udce9.mov\n')
+
+    def test_failing_stream_keeps_counting(self):
+        stream = mock.Mock(encoding='utf-8')
+        stream.write.side_effect = BrokenPipeError
+        counts, _ = self.run_log([('Copied', 'a'), ('Failed', 'b')], stream=stream)
+        self.assertEqual(counts, Counter({'Copied': 1, 'Failed': 1}))
+
+
+class FastMoveTest(TempDirTestCase):
+
+    MTIME = datetime(2015, 3, 1, 8, 30, 0).timestamp()
+
+    def assert_moved(self, src_path, dest_path):
+        self.assertFalse(os.path.exists(src_path))
+        with open(dest_path, 'rb') as f:
+            self.assertEqual(f.read(), b'photo')
+        self.assertEqual(os.stat(dest_path).st_mtime, self.MTIME)
+
+    def test_same_device_renames(self):
+        src_path = self.touch('src/a.jpg', b'photo', self.MTIME)
+        dest_path = os.path.join(self.tmp.name, 'a.jpg')
+        organise_photos._fast_move(src_path, dest_path)
+        self.assert_moved(src_path, dest_path)
+
+    def test_exdev_falls_back_to_copy_and_unlink(self):
+        src_path = self.touch('src/a.jpg', b'photo', self.MTIME)
+        dest_path = os.path.join(self.tmp.name, 'a.jpg')
+        exdev = OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        with mock.patch.object(organise_photos.os, 'replace', side_effect=exdev) as replace:
+            organise_photos._fast_move(src_path, dest_path)
+        replace.assert_called_once()
+        self.assert_moved(src_path, dest_path)
+
+    def test_other_rename_errors_propagate(self):
+        src_path = self.touch('src/a.jpg', b'photo', self.MTIME)
+        dest_path = os.path.join(self.tmp.name, 'a.jpg')
+        eacces = OSError(errno.EACCES, os.strerror(errno.EACCES))
+        with mock.patch.object(organise_photos.os, 'replace', side_effect=eacces):
+            with self.assertRaises(PermissionError):
+                organise_photos._fast_move(src_path, dest_path)
+        self.assertTrue(os.path.exists(src_path))
+        self.assertFalse(os.path.exists(dest_path))
+
+    def test_cross_device_skips_rename(self):
+        src_path = self.touch('src/a.jpg', b'photo', self.MTIME)
+        dest_path = os.path.join(self.tmp.name, 'a.jpg')
+        with mock.patch.object(organise_photos.os, 'replace') as replace:
+            organise_photos._fast_move(src_path, dest_path, same_device=False)
+        replace.assert_not_called()
+        self.assert_moved(src_path, dest_path)
+
+    def test_existing_destination_is_never_replaced(self):
+        src_path = self.touch('src/a.jpg', b'photo', self.MTIME)
+        dest_path = self.touch('a.jpg', b'keep')
+        for same_device in (True, False):
+            with self.assertRaises(FileExistsError):
+                organise_photos._fast_move(src_path, dest_path, same_device=same_device)
+        with open(dest_path, 'rb') as f:
+            self.assertEqual(f.read(), b'keep')
+        self.assertTrue(os.path.exists(src_path))
+
+
+if __name__ == '__main__':
+    unittest.main()